@@ -12,6 +12,11 @@ logger = init_logger(__name__)
 
 _GB = 1 << 30
 
+_VALID_LOAD_FORMATS = frozenset(
+    {"auto", "pt", "safetensors", "npcache", "dummy"})
+_VALID_TOKENIZER_MODES = frozenset({"auto", "slow"})
+_SUPPORTED_QUANTIZATION = frozenset({"awq", "gptq", "squeezellm"})
+
 
 class ModelConfig:
     """Configuration for the model.
@@ -82,9 +87,7 @@ class ModelConfig:
 
     def _verify_load_format(self) -> None:
         load_format = self.load_format.lower()
-        if load_format not in [
-                "auto", "pt", "safetensors", "npcache", "dummy"
-        ]:
+        if load_format not in _VALID_LOAD_FORMATS:
             raise ValueError(
                 f"Unknown load format: {self.load_format}. Must be one of "
                 "'auto', 'pt', 'safetensors', 'npcache', or 'dummy'.")
@@ -92,25 +95,27 @@ class ModelConfig:
 
     def _verify_tokenizer_mode(self) -> None:
         tokenizer_mode = self.tokenizer_mode.lower()
-        if tokenizer_mode not in ["auto", "slow"]:
+        if tokenizer_mode not in _VALID_TOKENIZER_MODES:
             raise ValueError(
                 f"Unknown tokenizer mode: {self.tokenizer_mode}. Must be "
                 "either 'auto' or 'slow'.")
         self.tokenizer_mode = tokenizer_mode
 
     def _verify_quantization(self) -> None:
-        supported_quantization = ["awq", "gptq"]
-        if hasattr(self.hf_config, "quantization_config"
-                   ) and self.hf_config.quantization_config.get(
-                       "quant_method") == QuantizationMethod.GPTQ:
-            self.quantization = "gptq"
+        if hasattr(self.hf_config, "quantization_config"):
+            quant_method = self.hf_config.quantization_config.get(
+                "quant_method")
+            if quant_method == QuantizationMethod.GPTQ:
+                self.quantization = "gptq"
+            elif quant_method == "squeezellm":
+                self.quantization = "squeezellm"
         if self.quantization is None:
             return
         quantization = self.quantization.lower()
-        if quantization not in supported_quantization:
+        if quantization not in _SUPPORTED_QUANTIZATION:
             raise ValueError(
                 f"Unknown quantization: {self.quantization}. Must be one of "
-                f"{supported_quantization}.")
+                f"{sorted(_SUPPORTED_QUANTIZATION)}.")
         self.quantization = quantization
 
     def verify_with_parallel_config(
@@ -339,7 +344,6 @@ def _get_and_verify_max_len(
     max_model_len: Optional[int],
 ) -> int:
     """Get and verify the model's maximum length."""
-    derived_max_model_len = float("inf")
     possible_keys = [
         "max_position_embeddings",
         "n_positions",
@@ -348,14 +352,19 @@ def _get_and_verify_max_len(
         "max_seq_length",
         "seq_len",
     ]
-    for key in possible_keys:
-        max_len_key = getattr(hf_config, key, None)
-        if max_len_key is not None:
-            derived_max_model_len = min(derived_max_model_len, max_len_key)
-    if derived_max_model_len == float('inf'):
+    # A single dict lookup per key instead of repeated getattr calls on
+    # the config object.
+    config_dict = (hf_config.to_dict()
+                   if hasattr(hf_config, "to_dict") else vars(hf_config))
+    candidates = [
+        config_dict[key] for key in possible_keys
+        if config_dict.get(key) is not None
+    ]
+    if not candidates:
         raise ValueError(
             "The model's config.json must contain one of the following keys "
             f"to determine the original maximum length of the model: {possible_keys}")
+    derived_max_model_len = min(candidates)
 
     rope_scaling = getattr(hf_config, "rope_scaling", None)
     if rope_scaling is not None:
@@ -368,7 +377,7 @@ def _get_and_verify_max_len(
     elif max_model_len > derived_max_model_len:
         raise ValueError(
             f"User-specified max_model_len ({max_model_len}) is greater than "
-            f"the derived max_model_len ({max_len_key}={derived_max_model_len}"
+            f"the derived max_model_len ({derived_max_model_len}"
             " in model's config.json). This may lead to incorrect model "
             "outputs or CUDA errors. Make sure the value is correct and "
             "within the model context size.")
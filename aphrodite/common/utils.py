@@ -1,5 +1,6 @@
 """Utils."""
 import enum
+import functools
 from platform import uname
 import uuid
 
@@ -41,8 +42,13 @@ def get_gpu_memory(gpu: int = 0) -> int:
     return torch.cuda.get_device_properties(gpu).total_memory
 
 
+@functools.lru_cache(maxsize=1)
 def get_cpu_memory() -> int:
-    """Returns the total CPU memory of the node in bytes."""
+    """Returns the total CPU memory of the node in bytes.
+
+    The total memory never changes over the lifetime of the process, so
+    the psutil syscall is only made once.
+    """
     return psutil.virtual_memory().total
 
 
@@ -4,12 +4,16 @@ from aphrodite.modeling.layers.quantized_linear.awq import (
     AWQColumnParallelLinear, AWQRowParallelLinear)
 from aphrodite.modeling.layers.quantized_linear.gptq import(
     GPTQColumnParallelLinear, GPTQRowParallelLinear, GPTQLinear)
+from aphrodite.modeling.layers.quantized_linear.squeezellm import (
+    SqueezeLLMColumnParallelLinear, SqueezeLLMRowParallelLinear)
 from aphrodite.modeling.megatron.layers import (
     ColumnParallelLinear, RowParallelLinear)
 
 _QUANTIZED_LINEAR_REGISTRY = {
     "awq": (AWQColumnParallelLinear, AWQRowParallelLinear, None),
     "gptq": (GPTQColumnParallelLinear, GPTQRowParallelLinear, GPTQLinear),
+    "squeezellm":
+    (SqueezeLLMColumnParallelLinear, SqueezeLLMRowParallelLinear, None),
 }
 
 
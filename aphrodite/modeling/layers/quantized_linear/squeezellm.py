@@ -0,0 +1,231 @@
+from typing import Optional
+
+import torch
+
+from aphrodite import quantization_ops
+from aphrodite.modeling.megatron.layers import (
+    ColumnParallelLinear, RowParallelLinear)
+
+# Minimum number of input tokens for which apply_weights dequantizes the
+# weights on the fly and uses a tensor-core GEMM instead of the
+# CUDA-core lookup kernel. The dequantization is eager and touches the
+# whole weight matrix, so it only breaks even at prefill-scale token
+# counts; decode steps (even with many sequences batched) must stay on
+# the lookup kernel, which reads each packed weight once per batch
+# element.
+_DENSE_MATMUL_MIN_TOKENS = 256
+
+# Number of input rows expanded per step when dequantizing the repacked
+# weights, bounding the unpack/gather-index transients to a few MB
+# instead of scaling with the full weight matrix.
+_DEQUANT_ROW_CHUNK = 512
+
+
+def _unpack_qweight(qweight: torch.Tensor, pack_factor: int) -> torch.Tensor:
+    """Unpack along the input dim: [in / 8, out] -> [in, out]."""
+    height, width = qweight.shape
+    shifts = torch.arange(0,
+                          32,
+                          4,
+                          device=qweight.device,
+                          dtype=torch.int32)
+    unpacked = (qweight.unsqueeze(1) >> shifts.view(1, -1, 1)) & 0xF
+    return unpacked.reshape(height * pack_factor, width)
+
+
+def _repack_qweight(qweight: torch.Tensor,
+                    pack_factor: int) -> torch.Tensor:
+    """Repack the nibbles of each int32 from the input to the output dim.
+
+    Checkpoints pack 8 consecutive input-dim weights per int32, which
+    forces the kernel through a serial shift chain to unpack one column.
+    Packing 8 consecutive output columns at the same input position
+    instead lets each thread extract one nibble per reduction step from a
+    single coalesced 32-bit load. [in / 8, out] -> [in, out / 8].
+    """
+    unpacked = _unpack_qweight(qweight, pack_factor)
+    height, width = unpacked.shape
+    # Repack along the output dim: [in, out] -> [in, out / 8].
+    repacked = torch.zeros(height,
+                           width // pack_factor,
+                           device=qweight.device,
+                           dtype=torch.int32)
+    for i in range(pack_factor):
+        repacked |= unpacked[:, i::pack_factor] << (4 * i)
+    return repacked
+
+
+def _dequantize_qweight(qweight: torch.Tensor, lookup_table: torch.Tensor,
+                        pack_factor: int) -> torch.Tensor:
+    """Expand the packed weights to a dense [in, out] FP16 matrix."""
+    idx = _unpack_qweight(qweight, pack_factor).long()
+    return lookup_table.t().gather(0, idx)
+
+
+def _dequantize_repacked_qweight(qweight: torch.Tensor,
+                                 lookup_table: torch.Tensor,
+                                 pack_factor: int) -> torch.Tensor:
+    """Like _dequantize_qweight, but for the [in, out / 8] repacked layout.
+
+    The expansion runs in chunks of input rows so that only the dense
+    FP16 result is materialized at full size; the int32 unpack and int64
+    gather-index transients stay bounded by _DEQUANT_ROW_CHUNK.
+    """
+    height, width = qweight.shape
+    out_width = width * pack_factor
+    shifts = torch.arange(0,
+                          32,
+                          4,
+                          device=qweight.device,
+                          dtype=torch.int32)
+    lut_t = lookup_table.t()
+    dense = torch.empty(height,
+                        out_width,
+                        device=qweight.device,
+                        dtype=lookup_table.dtype)
+    for start in range(0, height, _DEQUANT_ROW_CHUNK):
+        chunk = qweight[start:start + _DEQUANT_ROW_CHUNK]
+        # Unpack along the output dim: [rows, out / 8] -> [rows, out].
+        unpacked = (chunk.unsqueeze(-1) >> shifts) & 0xF
+        idx = unpacked.reshape(chunk.shape[0], out_width).long()
+        torch.gather(lut_t, 0, idx, out=dense[start:start + chunk.shape[0]])
+    return dense
+
+
+class SqueezeLLMColumnParallelLinear(ColumnParallelLinear):
+
+    def create_weights(self, dtype: torch.dtype) -> None:
+        assert self.input_size % self.quant_config.pack_factor == 0
+        # NOTE: The quantized tensors are inference-only, so they are
+        # registered as buffers rather than Parameters: they still move
+        # with .to()/.cuda() and appear in the state dict, but skip the
+        # autograd bookkeeping that Parameters incur on every forward.
+        self.register_buffer(
+            "qweight",
+            torch.empty(
+                self.input_size // self.quant_config.pack_factor,
+                self.output_size_per_partition,
+                device="cuda",
+                dtype=torch.int32,
+            ))
+        self.register_buffer(
+            "lookup_table",
+            torch.empty(
+                self.output_size_per_partition,
+                self.quant_config.weight_bits**2,
+                device="cuda",
+                dtype=dtype,
+            ))
+        # Set by post_init when the weights are dequantized at load time.
+        self.register_buffer("dense_weight", None)
+
+    def post_init(self, dequantize: bool = False):
+        if dequantize:
+            self.dense_weight = _dequantize_qweight(
+                self.qweight, self.lookup_table,
+                self.quant_config.pack_factor)
+            del self.qweight
+            del self.lookup_table
+        else:
+            self.qweight = _repack_qweight(self.qweight,
+                                           self.quant_config.pack_factor)
+
+    def apply_weights(
+        self,
+        x: torch.Tensor,
+        bias: Optional[torch.Tensor],
+    ) -> torch.Tensor:
+        out_shape = x.shape[:-1] + (self.output_size_per_partition, )
+        # The activations are contiguous here, so .view avoids reshape's
+        # per-call stride analysis on the decode hot path.
+        reshaped_x = x.view(-1, x.shape[-1])
+        if self.dense_weight is not None:
+            # FP16 GEMM on tensor cores via cuBLAS.
+            if bias is None:
+                out = torch.matmul(reshaped_x, self.dense_weight)
+            else:
+                out = torch.addmm(bias, reshaped_x, self.dense_weight)
+            return out.view(out_shape)
+        if reshaped_x.shape[0] >= _DENSE_MATMUL_MIN_TOKENS:
+            dense_weight = _dequantize_repacked_qweight(
+                self.qweight, self.lookup_table,
+                self.quant_config.pack_factor)
+            if bias is None:
+                out = torch.matmul(reshaped_x, dense_weight)
+            else:
+                out = torch.addmm(bias, reshaped_x, dense_weight)
+            return out.view(out_shape)
+        # NOTE: The kernel fully overwrites the output, so there is no
+        # need to zero-fill it.
+        out = torch.empty(reshaped_x.shape[0],
+                          self.output_size_per_partition,
+                          device=x.device,
+                          dtype=torch.float16)
+        # The bias is added in the kernel's store epilogue, which avoids a
+        # separate elementwise kernel and its output allocation.
+        quantization_ops.squeezellm_gemm(reshaped_x, self.qweight, out,
+                                         self.lookup_table, bias)
+        return out.view(out_shape)
+
+
+class SqueezeLLMRowParallelLinear(RowParallelLinear):
+
+    def create_weights(self, dtype: torch.dtype) -> None:
+        assert (self.input_size_per_partition %
+                self.quant_config.pack_factor == 0)
+        # NOTE: See SqueezeLLMColumnParallelLinear.create_weights for why
+        # these are buffers instead of Parameters.
+        self.register_buffer(
+            "qweight",
+            torch.empty(
+                self.input_size_per_partition // self.quant_config.pack_factor,
+                self.output_size,
+                device="cuda",
+                dtype=torch.int32,
+            ))
+        self.register_buffer(
+            "lookup_table",
+            torch.empty(
+                self.output_size,
+                self.quant_config.weight_bits**2,
+                device="cuda",
+                dtype=dtype,
+            ))
+        # Set by post_init when the weights are dequantized at load time.
+        self.register_buffer("dense_weight", None)
+
+    def post_init(self, dequantize: bool = False):
+        if dequantize:
+            self.dense_weight = _dequantize_qweight(
+                self.qweight, self.lookup_table,
+                self.quant_config.pack_factor)
+            del self.qweight
+            del self.lookup_table
+        else:
+            self.qweight = _repack_qweight(self.qweight,
+                                           self.quant_config.pack_factor)
+
+    def apply_weights(self, x: torch.Tensor) -> torch.Tensor:
+        out_shape = x.shape[:-1] + (self.output_size, )
+        # The activations are contiguous here, so .view avoids reshape's
+        # per-call stride analysis on the decode hot path.
+        reshaped_x = x.view(-1, x.shape[-1])
+        if self.dense_weight is not None:
+            # FP16 GEMM on tensor cores via cuBLAS.
+            out = torch.matmul(reshaped_x, self.dense_weight)
+            return out.view(out_shape)
+        if reshaped_x.shape[0] >= _DENSE_MATMUL_MIN_TOKENS:
+            dense_weight = _dequantize_repacked_qweight(
+                self.qweight, self.lookup_table,
+                self.quant_config.pack_factor)
+            out = torch.matmul(reshaped_x, dense_weight)
+            return out.view(out_shape)
+        # NOTE: The kernel fully overwrites the output, so there is no
+        # need to zero-fill it.
+        out = torch.empty(reshaped_x.shape[0],
+                          self.output_size,
+                          device=x.device,
+                          dtype=torch.float16)
+        quantization_ops.squeezellm_gemm(reshaped_x, self.qweight, out,
+                                         self.lookup_table, None)
+        return out.view(out_shape)
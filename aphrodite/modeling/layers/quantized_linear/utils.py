@@ -5,6 +5,8 @@ import torch
 from aphrodite import quantization_ops
 from aphrodite.modeling.layers.quantized_linear.gptq import (
     GPTQColumnParallelLinear, GPTQRowParallelLinear, GPTQLinear)
+from aphrodite.modeling.layers.quantized_linear.squeezellm import (
+    SqueezeLLMColumnParallelLinear, SqueezeLLMRowParallelLinear)
 
 def quant_post_init(model, max_input_length: Optional[int] = None):
     device_to_buffers_size = {}
@@ -80,4 +82,23 @@ def quant_post_init(model, max_input_length: Optional[int] = None):
                 submodule.post_init()
 
         torch.cuda.empty_cache()
+
+    squeezellm_modules = [
+        submodule for _, submodule in model.named_modules()
+        if isinstance(submodule, (SqueezeLLMColumnParallelLinear,
+                                  SqueezeLLMRowParallelLinear))
+    ]
+    if squeezellm_modules:
+        dequantize = squeezellm_modules[0].quant_config.dequantize_at_load
+        if dequantize is None:
+            # Dense FP16 weights take 4x the packed size. Auto-enable the
+            # dequantized path only when there is ample headroom, since
+            # free VRAM is also needed for the KV cache.
+            packed_bytes = sum(module.qweight.numel() * 4
+                               for module in squeezellm_modules)
+            free_memory, _ = torch.cuda.mem_get_info()
+            dequantize = free_memory > 4 * packed_bytes * 4
+        for submodule in squeezellm_modules:
+            submodule.post_init(dequantize)
+        torch.cuda.empty_cache()
     return model
\ No newline at end of file
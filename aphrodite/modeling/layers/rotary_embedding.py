@@ -22,14 +22,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Rotary Positional Embeddings."""
-from typing import Tuple, Union
+from typing import Dict, Tuple, Union
 import math
 
+import numpy as np
 import torch
 import torch.nn as nn
 
 from aphrodite import pos_encoding_ops
 
+# The cos/sin cache only depends on the rotary hyperparameters, so all
+# layers with identical settings (e.g., every decoder layer of a model)
+# can share a single table instead of rebuilding it on CUDA once per
+# layer. The cache is keyed on the class plus every hyperparameter that
+# affects the table; see `RotaryEmbedding._cache_key`.
+_COS_SIN_CACHES: Dict[Tuple, torch.Tensor] = {}
+
 
 class RotaryEmbedding(nn.Module):
     """Original rotary positional embedding."""
@@ -49,10 +57,19 @@ class RotaryEmbedding(nn.Module):
         self.base = base
         self.is_neox_style = is_neox_style
 
-        cache = self._compute_cos_sin_cache()
-        cache = cache.to(torch.get_default_dtype())
+        key = self._cache_key()
+        cache = _COS_SIN_CACHES.get(key)
+        if cache is None:
+            cache = self._compute_cos_sin_cache(torch.get_default_dtype())
+            _COS_SIN_CACHES[key] = cache
         self.register_buffer("cos_sin_cache", cache, persistent=False)
 
+    def _cache_key(self) -> Tuple:
+        """Key identifying the cos/sin cache of this layer."""
+        return (self.__class__, self.head_size, self.rotary_dim,
+                self.max_position_embeddings, self.base, self.is_neox_style,
+                torch.get_default_dtype())
+
     def _compute_inv_freq(self, base: Union[int, float]) -> torch.Tensor:
         """Compute the inverse frequency."""
         # NOTE: The HF implementation uses `torch.arange(...).float()`.
@@ -69,18 +86,49 @@ class RotaryEmbedding(nn.Module):
                                  self.rotary_dim))
         return inv_freq
 
-    def _compute_cos_sin_cache(self) -> torch.Tensor:
+    def _make_cos_sin_cache(self,
+                            freqs: torch.Tensor,
+                            dtype: torch.dtype,
+                            scale: float = 1.0) -> torch.Tensor:
+        """Build the [num_positions, rotary_dim] cache from the frequencies.
+
+        The frequencies stay in FP32 for precision, while the cos and sin
+        values are written directly into a preallocated buffer of the
+        target dtype. This avoids materializing separate cos/sin tensors,
+        an extra concatenation allocation + copy, and an FP32-sized cache
+        for FP16/BF16 models.
+
+        Each cos/sin pair is interleaved ([cos0, sin0, cos1, sin1, ...])
+        so the rotary kernel can fetch a pair with one 32-bit load.
+
+        An optional scalar `scale` (e.g. the YaRN mscale) is applied with
+        a single in-place multiply over the final buffer.
+        """
+        num_positions, embed_dim = freqs.shape
+        cache = torch.empty(num_positions,
+                            2 * embed_dim,
+                            dtype=dtype,
+                            device=freqs.device)
+        if dtype == freqs.dtype:
+            torch.cos(freqs, out=cache[:, 0::2])
+            torch.sin(freqs, out=cache[:, 1::2])
+        else:
+            # Slice assignment fuses the dtype cast into the copy.
+            cache[:, 0::2] = torch.cos(freqs)
+            cache[:, 1::2] = torch.sin(freqs)
+        if scale != 1.0:
+            cache.mul_(scale)
+        return cache
+
+    def _compute_cos_sin_cache(self, dtype: torch.dtype) -> torch.Tensor:
         """Compute the cos and sin cache."""
         inv_freq = self._compute_inv_freq(self.base)
         t = torch.arange(self.max_position_embeddings,
                          dtype=torch.float,
                          device="cuda")
 
-        freqs = torch.einsum("i,j -> ij", t, inv_freq)
-        cos = freqs.cos()
-        sin = freqs.sin()
-        cache = torch.cat((cos, sin), dim=-1)
-        return cache
+        freqs = torch.outer(t, inv_freq)
+        return self._make_cos_sin_cache(freqs, dtype)
 
     def forward(
         self,
@@ -115,7 +163,10 @@ class LinearScalingRotaryEmbedding(RotaryEmbedding):
         super().__init__(head_size, rotary_dim, max_position_embeddings, base,
                          is_neox_style)
 
-    def _compute_cos_sin_cache(self) -> torch.Tensor:
+    def _cache_key(self) -> Tuple:
+        return super()._cache_key() + (self.scaling_factor, )
+
+    def _compute_cos_sin_cache(self, dtype: torch.dtype) -> torch.Tensor:
         inv_freq = self._compute_inv_freq(self.base)
         # NOTE: self.max_position_embeddings is the original
         # maximum length before applying the rope scaling.
@@ -125,11 +176,8 @@ class LinearScalingRotaryEmbedding(RotaryEmbedding):
         t = torch.arange(max_len, dtype=torch.float, device="cuda")
         t = t / self.scaling_factor
 
-        freqs = torch.einsum("i,j -> ij", t, inv_freq)
-        cos = freqs.cos()
-        sin = freqs.sin()
-        cache = torch.cat((cos, sin), dim=-1)
-        return cache
+        freqs = torch.outer(t, inv_freq)
+        return self._make_cos_sin_cache(freqs, dtype)
 
 
 class DynamicNTKScalingRotaryEmbedding(RotaryEmbedding):
@@ -151,7 +199,10 @@ class DynamicNTKScalingRotaryEmbedding(RotaryEmbedding):
         super().__init__(head_size, rotary_dim, max_position_embeddings, base,
                          is_neox_style)
 
-    def _compute_cos_sin_cache(self) -> torch.Tensor:
+    def _cache_key(self) -> Tuple:
+        return super()._cache_key() + (self.scaling_factor, )
+
+    def _compute_cos_sin_cache(self, dtype: torch.dtype) -> torch.Tensor:
         # NOTE: self.max_position_embeddings is the original
         # maximum length before applying the rope scaling.
         # Thus, the maximum length after applying the rope scaling is
@@ -164,11 +215,8 @@ class DynamicNTKScalingRotaryEmbedding(RotaryEmbedding):
         inv_freq = self._compute_inv_freq(base)
         t = torch.arange(max_len, dtype=torch.float, device="cuda")
 
-        freqs = torch.einsum("i,j -> ij", t, inv_freq)
-        cos = freqs.cos()
-        sin = freqs.sin()
-        cache = torch.cat((cos, sin), dim=-1)
-        return cache
+        freqs = torch.outer(t, inv_freq)
+        return self._make_cos_sin_cache(freqs, dtype)
     
 def _yarn_find_correction_dim(num_rotations: int,
                               dim: int,
@@ -195,10 +243,12 @@ def _yarn_linear_ramp_mask(low: float, high: float, dim: int,
     if low == high:
         high += 0.001
 
-    linear_func = (torch.arange(dim, dtype=dtype, device=device) -
-                   low) / (high - low)
-    ramp_func = torch.clamp(linear_func, 0, 1)
-    return ramp_func
+    # The mask has at most rotary_dim // 2 (<= 64) elements; computing it
+    # with NumPy on the CPU and copying it over once is cheaper than
+    # launching CUDA kernels for such a tiny tensor.
+    ramp_func = np.clip(
+        (np.arange(dim, dtype=np.float32) - low) / (high - low), 0, 1)
+    return torch.from_numpy(ramp_func).to(device=device, dtype=dtype)
 
 def _yarn_get_mscale(scale: float = 1) -> float:
     if scale <= 1:
@@ -231,7 +281,13 @@ class YaRNScalingRotaryEmbedding(RotaryEmbedding):
         self.mscale = float(
             _yarn_get_mscale(self.scaling_factor) * attn_factor) # get n-d magnitude scaling corrected for interpolation
         super().__init__(head_size, rotary_dim, max_position_embeddings, base, is_neox_style)
-    
+
+    def _cache_key(self) -> Tuple:
+        return super()._cache_key() + (self.scaling_factor,
+                                       self.extrapolation_factor,
+                                       self.attn_factor, self.beta_fast,
+                                       self.beta_slow)
+
     def _compute_inv_freq(self, scaling_factor: float) -> torch.Tensor:
         pos_freqs = self.base**(torch.arange(
             0, self.rotary_dim, 2, dtype=torch.float, device="cuda") /
@@ -250,13 +306,10 @@ class YaRNScalingRotaryEmbedding(RotaryEmbedding):
             1 - inv_freq_mask) + inv_freq_extrapolation * inv_freq_mask
         return inv_freq
     
-    def _compute_cos_sin_cache(self) -> torch.Tensor:
+    def _compute_cos_sin_cache(self, dtype: torch.dtype) -> torch.Tensor:
         inv_freq = self._compute_inv_freq(self.scaling_factor)
         t = torch.arange(self.max_position_embeddings * self.scaling_factor,
                          device="cuda",
                          dtype=torch.float32)
-        freqs = torch.einsum("i,j -> ij", t, inv_freq)
-        cos = (freqs.cos() * self.mscale)
-        sin = (freqs.sin() * self.mscale)
-        cache = torch.cat((cos, sin), dim=-1)
-        return cache
\ No newline at end of file
+        freqs = torch.outer(t, inv_freq)
+        return self._make_cos_sin_cache(freqs, dtype, scale=self.mscale)
\ No newline at end of file
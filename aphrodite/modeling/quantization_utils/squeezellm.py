@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional
+
+import torch
+
+from aphrodite.modeling.quantization_utils.base import QuantizationConfig
+
+
+class SqueezeLLMConfig(QuantizationConfig):
+    """Config class for SqueezeLLM.
+
+    Reference: https://arxiv.org/abs/2306.07629
+
+    Args:
+        weight_bits: Number of bits per quantized weight.
+        dequantize_at_load: Expand the weights to dense FP16 at load time,
+            trading 4x weight VRAM for cuBLAS (tensor core) matmuls. If
+            None, enabled automatically when there is ample free VRAM.
+    """
+
+    def __init__(
+        self,
+        weight_bits: int,
+        dequantize_at_load: Optional[bool] = None,
+    ) -> None:
+        self.weight_bits = weight_bits
+        self.dequantize_at_load = dequantize_at_load
+
+        if self.weight_bits != 4:
+            raise ValueError(
+                "Currently, only 4-bit weight quantization is supported for "
+                f"SqueezeLLM, but got {self.weight_bits} bits.")
+        self.pack_factor = 32 // self.weight_bits
+
+    def __repr__(self) -> str:
+        return (f"SqueezeLLMConfig(weight_bits={self.weight_bits}, "
+                f"dequantize_at_load={self.dequantize_at_load})")
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "squeezellm"
+
+    @classmethod
+    def get_supported_act_dtypes(cls) -> List[torch.dtype]:
+        return [torch.half]
+
+    @classmethod
+    def get_min_capability(cls) -> int:
+        return 70
+
+    @classmethod
+    def get_config_filenames(cls) -> List[str]:
+        return ["quant_config.json"]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SqueezeLLMConfig":
+        weight_bits = cls.get_from_keys(config, ["wbits", "bits"])
+        return cls(weight_bits)
+
+    @classmethod
+    def get_packed_tensor_names(cls) -> List[str]:
+        # The qweight is packed along the input dimension, which is never
+        # re-offset during weight loading, so no tensor needs the packed
+        # shard-size adjustment.
+        return []
+
+    @classmethod
+    def get_transposed_tensor_names(cls) -> List[str]:
+        return ["qweight"]
+
+    def get_row_tp_tensor_names(self) -> List[str]:
+        return ["qweight"]
+
+    def get_column_tp_tensor_names(self) -> List[str]:
+        return ["qweight", "lookup_table", "bias"]
@@ -8,26 +8,25 @@ namespace aphrodite {
 template<typename scalar_t, bool IS_NEOX>
 inline __device__ void apply_rotary_embedding(
   scalar_t* __restrict__ arr,
-  const scalar_t* __restrict__ cos_ptr,
-  const scalar_t* __restrict__ sin_ptr,
+  const scalar_t* __restrict__ cache_ptr,
   int rot_offset,
   int embed_dim)
 {
   int x_index, y_index;
-  scalar_t cos, sin;
   if (IS_NEOX) {
     // GPT-NeoX style rotary embedding.
     x_index = rot_offset;
     y_index = embed_dim + rot_offset;
-    cos = __ldg(cos_ptr + x_index);
-    sin = __ldg(sin_ptr + x_index);
   } else {
     // GPT-J style rotary embedding.
     x_index = 2 * rot_offset;
     y_index = 2 * rot_offset + 1;
-    cos = __ldg(cos_ptr + x_index / 2);
-    sin = __ldg(sin_ptr + x_index / 2);
   }
+  // The cache interleaves each cos/sin pair, so the two 16-bit loads
+  // below hit adjacent addresses and coalesce into one 32-bit
+  // transaction for FP16/BF16 caches.
+  const scalar_t cos = __ldg(cache_ptr + 2 * rot_offset);
+  const scalar_t sin = __ldg(cache_ptr + 2 * rot_offset + 1);
 
   const scalar_t x = arr[x_index];
   const scalar_t y = arr[y_index];
@@ -40,7 +39,8 @@ __global__ void rotary_embedding_kernel(
   const int64_t* __restrict__ positions,        // [num_tokens]
   scalar_t* __restrict__ query,                 // [num_tokens, num_heads, head_size]
   scalar_t* __restrict__ key,                   // [num_tokens, num_kv_heads, head_size]
-  const scalar_t* __restrict__ cos_sin_cache,   // [max_position, 2, rot_dim // 2]
+  const scalar_t* __restrict__ cos_sin_cache,   // [max_position, rot_dim],
+                                                // interleaved [cos0, sin0, ...]
   const int rot_dim,
   const int query_stride,
   const int key_stride,
@@ -53,16 +53,13 @@ __global__ void rotary_embedding_kernel(
   const scalar_t* cache_ptr = cos_sin_cache + pos * rot_dim;
 
   const int embed_dim = rot_dim / 2;
-  const scalar_t* cos_ptr = cache_ptr;
-  const scalar_t* sin_ptr = cache_ptr + embed_dim;
-
   const int nq = num_heads * embed_dim;
   for (int i = threadIdx.x; i < nq; i += blockDim.x) {
     const int head_idx = i / embed_dim;
     const int token_head = token_idx * query_stride + head_idx * head_size;
     const int rot_offset = i % embed_dim;
-    apply_rotary_embedding<scalar_t, IS_NEOX>(query + token_head, cos_ptr,
-                                              sin_ptr, rot_offset, embed_dim);
+    apply_rotary_embedding<scalar_t, IS_NEOX>(query + token_head, cache_ptr,
+                                              rot_offset, embed_dim);
   }
 
   const int nk = num_kv_heads * embed_dim;
@@ -70,8 +67,8 @@ __global__ void rotary_embedding_kernel(
     const int head_idx = i / embed_dim;
     const int token_head = token_idx * key_stride + head_idx * head_size;
     const int rot_offset = i % embed_dim;
-    apply_rotary_embedding<scalar_t, IS_NEOX>(key + token_head, cos_ptr,
-                                              sin_ptr, rot_offset, embed_dim);
+    apply_rotary_embedding<scalar_t, IS_NEOX>(key + token_head, cache_ptr,
+                                              rot_offset, embed_dim);
   }
 }
 
@@ -82,7 +79,7 @@ void rotary_embedding(
   torch::Tensor& query,             // [num_tokens, num_heads * head_size]
   torch::Tensor& key,               // [num_tokens, num_kv_heads * head_size]
   int head_size,
-  torch::Tensor& cos_sin_cache,     // [max_position, rot_dim]
+  torch::Tensor& cos_sin_cache,     // [max_position, rot_dim], interleaved
   bool is_neox) {
   int num_tokens = query.size(0);
   int rot_dim = cos_sin_cache.size(1);
@@ -38,6 +38,13 @@ void gptq_descact_matmul(
   torch::Tensor zeros,
   torch::Tensor g_idx);
 
+void squeezellm_gemm(
+  torch::Tensor vec,
+  torch::Tensor mat,
+  torch::Tensor mul,
+  torch::Tensor lookup_table,
+  const c10::optional<torch::Tensor>& bias);
+
 
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
   m.def(
@@ -64,4 +71,8 @@ PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
     "gptq_descact_matmul",
     &gptq_descact_matmul,
     "Quantized GEMM for GPTQ for parallelized desc_act layer.");
+  m.def(
+    "squeezellm_gemm",
+    &squeezellm_gemm,
+    "Quantized GEMM for SqueezeLLM");
 }
@@ -0,0 +1,143 @@
+/*
+Adapted from https://github.com/SqueezeAILab/SqueezeLLM
+@article{kim2023squeezellm,
+  title={SqueezeLLM: Dense-and-Sparse Quantization},
+  author={Kim, Sehoon and Hooper, Coleman and Gholami, Amir and Dong, Zhen and Li, Xiuyu and Shen, Sheng and Mahoney, Michael W and Keutzer, Kurt},
+  journal={arXiv},
+  year={2023}
+}
+ */
+
+#include <torch/extension.h>
+#include <ATen/cuda/CUDAContext.h>
+
+#include <cuda_fp16.h>
+
+// Threads per block. Each thread owns one packed int32 column, i.e. 8
+// output columns, so a block covers NUM_THREADS * 8 output columns of one
+// input row and walks the full reduction dimension. Every output element
+// is written exactly once, so the output tensor does not need to be
+// zero-initialized.
+#define NUM_THREADS 64
+// Output columns covered by one block.
+#define TILE_WIDTH (NUM_THREADS * 8)
+// Input elements staged per reduction step.
+#define TILE_HEIGHT NUM_THREADS
+
+namespace aphrodite {
+namespace squeezellm {
+
+// 4-bit non-uniform (lookup-table) matmul kernel.
+//
+// The weight matrix is repacked at load time (see _repack_qweight) so that
+// each int32 holds the nibbles of 8 consecutive *output* columns at one
+// input position. Adjacent threads therefore load adjacent int32s (fully
+// coalesced 128-byte transactions) and extract one nibble per column with
+// a single shift-and-mask instead of a serial 8-step unpack chain.
+__global__ void NUQ4MatMulKernel(
+  const half* __restrict__ vec,           // [batch, vec_height]
+  const int* __restrict__ mat,            // [height, width / 8]
+  half* __restrict__ mul,                 // [batch, width]
+  const half* __restrict__ lookup_table,  // [width, 16]
+  const half* __restrict__ bias,          // [width] or nullptr
+  int height,
+  int width,
+  int batch,
+  int vec_height) {
+
+  const int packed_width = width / 8;
+  const int packed_col = blockIdx.x * NUM_THREADS + threadIdx.x;
+  const int col_base = blockIdx.x * TILE_WIDTH;
+  const int b = blockIdx.y;
+
+  __shared__ half blockvec[TILE_HEIGHT];
+  // The 16-entry lookup tables of this block's columns are staged into
+  // shared memory once, so dequantization reads no global memory.
+  __shared__ half lut_smem[16][TILE_WIDTH];
+  for (int i = threadIdx.x; i < 16 * TILE_WIDTH; i += NUM_THREADS) {
+    const int c = i / 16;
+    const int v = i % 16;
+    if (col_base + c < width) {
+      lut_smem[v][c] = lookup_table[(col_base + c) * 16 + v];
+    }
+  }
+
+  float res[8];
+#pragma unroll
+  for (int j = 0; j < 8; ++j) {
+    res[j] = 0.0f;
+  }
+
+  for (int row = 0; row < height; row += TILE_HEIGHT) {
+    // Stage the slice of the input row this tile reduces over.
+    const int k = row + threadIdx.x;
+    blockvec[threadIdx.x] =
+      (k < vec_height) ? vec[b * vec_height + k] : __float2half(0.0f);
+    __syncthreads();
+
+    if (packed_col < packed_width) {
+      const int num_rows = min(TILE_HEIGHT, height - row);
+      for (int i = 0; i < num_rows; ++i) {
+        const unsigned int packed = mat[(row + i) * packed_width + packed_col];
+        const float x = __half2float(blockvec[i]);
+        const int local_col = threadIdx.x * 8;
+#pragma unroll
+        for (int j = 0; j < 8; ++j) {
+          const half weight =
+            lut_smem[(packed >> (4 * j)) & 0xF][local_col + j];
+          res[j] += __half2float(weight) * x;
+        }
+      }
+    }
+    __syncthreads();
+  }
+
+  if (packed_col < packed_width) {
+    const int col = packed_col * 8;
+    // Fused bias epilogue: one extra load per output element instead of
+    // a separate elementwise kernel (and its output allocation).
+    if (bias != nullptr) {
+#pragma unroll
+      for (int j = 0; j < 8; ++j) {
+        res[j] += __half2float(bias[col + j]);
+      }
+    }
+#pragma unroll
+    for (int j = 0; j < 8; ++j) {
+      mul[b * width + col + j] = __float2half(res[j]);
+    }
+  }
+}
+
+} // namespace squeezellm
+} // namespace aphrodite
+
+void squeezellm_gemm(
+  torch::Tensor vec,
+  torch::Tensor mat,
+  torch::Tensor mul,
+  torch::Tensor lookup_table,
+  const c10::optional<torch::Tensor>& bias) {
+  int height = mat.size(0);
+  int width = mul.size(1);
+  int batch = vec.size(0);
+  int vec_height = vec.size(1);
+
+  dim3 grid((mat.size(1) + NUM_THREADS - 1) / NUM_THREADS, batch);
+  dim3 block(NUM_THREADS);
+  const cudaStream_t stream = at::cuda::getCurrentCUDAStream();
+  aphrodite::squeezellm::NUQ4MatMulKernel<<<grid, block, 0, stream>>>(
+    (half*) vec.data_ptr<at::Half>(),
+    mat.data_ptr<int>(),
+    (half*) mul.data_ptr<at::Half>(),
+    (half*) lookup_table.data_ptr<at::Half>(),
+    bias.has_value() ? (half*) bias->data_ptr<at::Half>() : nullptr,
+    height,
+    width,
+    batch,
+    vec_height);
+}
+
+#undef NUM_THREADS
+#undef TILE_WIDTH
+#undef TILE_HEIGHT
@@ -205,7 +205,8 @@ quantization_extension = CUDAExtension(
         "kernels/quantization/gptq/cuda_func/q4_matmul.cu",
         "kernels/quantization/gptq/cuda_func/q4_matrix.cu",
         "kernels/quantization/gptq/alt_matmul_kernel.cu",
-        "kernels/quantization/gptq/alt_matmul.cpp"
+        "kernels/quantization/gptq/alt_matmul.cpp",
+        "kernels/quantization/squeezellm/quant_cuda_kernel.cu"
     ],
     extra_compile_args={
         "cxx": CXX_FLAGS,
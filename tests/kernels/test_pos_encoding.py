@@ -133,7 +133,8 @@ def test_rotary_embedding(
     freqs = torch.einsum("i,j -> ij", t, inv_freq)
     cos = freqs.cos()
     sin = freqs.sin()
-    cos_sin_cache = torch.cat((cos, sin), dim=-1)
+    # The kernel expects each cos/sin pair interleaved.
+    cos_sin_cache = torch.stack((cos, sin), dim=-1).flatten(-2)
     cos_sin_cache = cos_sin_cache.to(dtype=dtype, device='cuda')
 
     out_query = query.clone()